@@ -54,6 +54,10 @@ class SimulatedClock:
         self._waiters.append((target, event))
         await event.wait()
 
+    @property
+    def realtime(self) -> bool:
+        return self._realtime
+
     def set_realtime(self, enabled: bool = True) -> None:
         self._realtime = enabled
 
@@ -11,7 +11,7 @@ from typing import Any, AsyncIterator, Callable, Protocol, runtime_checkable
 # Core data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class AudioChunk:
     """A single chunk of audio data, as produced by a microphone or TTS."""
 
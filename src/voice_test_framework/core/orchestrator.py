@@ -53,6 +53,7 @@ class ScenarioOrchestrator:
         self.scenario: dict[str, Any] = {}
         if scenario_path is not None:
             self.scenario = self._load_scenario(scenario_path)
+        self._initial_scenario = self.scenario  # restored by ``reset``
 
         self.timeline: PriorityQueue[TimelineEvent] = PriorityQueue()
         self.clock = SimulatedClock()
@@ -67,6 +68,22 @@ class ScenarioOrchestrator:
         if hasattr(layer, "set_clock"):
             layer.set_clock(self.clock)
 
+    def reset(self) -> None:
+        """Rewind the clock, drop pending timeline events and reset layers.
+
+        Lets one wired orchestrator be reused across runs: the scenario and
+        clock mode go back to their construction-time values, and every layer
+        that has a ``reset`` method is restored as well.
+        """
+        self.scenario = self._initial_scenario
+        self.timeline = PriorityQueue()
+        self.clock.reset()
+        self.clock.set_realtime(False)
+        self._seq = 0
+        for layer in self.layers.values():
+            if hasattr(layer, "reset"):
+                layer.reset()
+
     # -- running a scenario --------------------------------------------------
 
     async def run(
@@ -67,7 +67,7 @@ class AccuracyMetrics:
     overall: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallRecord:
     """Single recorded tool invocation."""
 
@@ -77,6 +77,21 @@ class ToolCallRecord:
     success: bool = True
     latency_ms: float = 0.0
 
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "tool": self.tool,
+            "args": self.args,
+            "timestamp": self.timestamp,
+            "success": self.success,
+            "latency_ms": self.latency_ms,
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        # Call-log entries used to be plain dicts; keep ``entry["tool"]`` working.
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
 
 @dataclass
 class ToolCallResults:
@@ -144,6 +159,7 @@ class TestResults:
         self.assertions.append(result)
 
     def all_passed(self) -> bool:
+        # Not cached: ``assertions`` is a public list callers may edit freely
         return all(a.passed for a in self.assertions)
 
     @property
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -137,6 +138,14 @@ _HTML_TEMPLATE = """\
 """
 
 
+@lru_cache(maxsize=1)
+def _compiled_template() -> Any:
+    """Parse and compile the built-in template once per process."""
+    import jinja2
+
+    return jinja2.Environment(autoescape=True).from_string(_HTML_TEMPLATE)
+
+
 class HTMLReportGenerator:
     """Generate a self-contained HTML report from test results."""
 
@@ -150,13 +159,11 @@ class HTMLReportGenerator:
         evaluation_reports: list[dict[str, Any]] | None = None,
     ) -> Path:
         try:
-            import jinja2
+            template = _compiled_template()
         except ImportError:
             # Fall back to simple string formatting
             return self._generate_simple(all_results, output_path)
 
-        template = jinja2.Template(_HTML_TEMPLATE)
-
         passed = sum(1 for r in all_results if r.passed)
         failed = len(all_results) - passed
         total = len(all_results)
@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ..core.results import TestResults
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _read_baseline(path: str, mtime_ns: int, size: int) -> dict[str, float]:
+    """Parse a baseline file; the stat fields in the key invalidate stale entries."""
+    return _loads(Path(path).read_bytes())
+
+
 @dataclass
 class RegressionResult:
     """Outcome of a regression check."""
@@ -107,16 +132,23 @@ class RegressionDetector:
         """Flatten results into a dict of scalar metrics."""
         metrics: dict[str, float] = {}
         total = len(results)
-        passed = sum(1 for r in results if r.passed)
-        metrics["pass_rate"] = passed / total if total else 0
-
+        passed = 0
         latencies: list[float] = []
+        accuracies: list[float] = []
+        # Single pass over the results for every metric
         for r in results:
+            if r.passed:
+                passed += 1
             latencies.extend(r.latency.first_byte_latencies)
+            if r.accuracy.overall > 0:
+                accuracies.append(r.accuracy.overall)
+        metrics["pass_rate"] = passed / total if total else 0
+
         if latencies:
-            metrics["latency_p50"] = sorted(latencies)[len(latencies) // 2]
+            # Upper median; a partial partition is enough, no full sort
+            mid = len(latencies) // 2
+            metrics["latency_p50"] = float(np.partition(latencies, mid)[mid])
 
-        accuracies = [r.accuracy.overall for r in results if r.accuracy.overall > 0]
         if accuracies:
             metrics["accuracy_avg"] = sum(accuracies) / len(accuracies)
 
@@ -124,15 +156,15 @@ class RegressionDetector:
 
     def _load_baseline(self, name: str) -> dict[str, float] | None:
         path = self.baseline_dir / f"{name}.json"
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return None
-        with open(path) as fh:
-            return json.load(fh)
+        # Copy so callers can't corrupt the cached entry
+        return dict(_read_baseline(str(path), st.st_mtime_ns, st.st_size))
 
     def _save_baseline(self, results: list[TestResults], name: str) -> Path:
         self.baseline_dir.mkdir(parents=True, exist_ok=True)
         path = self.baseline_dir / f"{name}.json"
-        metrics = self._extract_metrics(results)
-        with open(path, "w") as fh:
-            json.dump(metrics, fh, indent=2)
+        path.write_bytes(_dumps(self._extract_metrics(results)))
         return path
@@ -11,6 +11,9 @@ import numpy as np
 
 from ..core.interfaces import AudioChunk, SimulationLayer
 
+# Plain prefix check; no regex needed for a fixed scheme.
+_TTS_SCHEME = "tts://"
+
 
 @dataclass
 class AudioConfig:
@@ -113,17 +116,9 @@ class AudioStreamSimulator:
         """Generate an audio stream from text or a pre-recorded file."""
         style = style or {}
 
-        if text and text.startswith("tts://"):
-            raw_audio = await self.tts_engine.synthesize(
-                text=text[6:],
-                voice=style.get("voice", "default"),
-                speed=style.get("speed", 1.0),
-                emotion=style.get("emotion", "neutral"),
-                sample_rate=self.sample_rate,
-            )
-        elif text:
+        if text:
             raw_audio = await self.tts_engine.synthesize(
-                text=text,
+                text=text.removeprefix(_TTS_SCHEME),
                 voice=style.get("voice", "default"),
                 speed=style.get("speed", 1.0),
                 emotion=style.get("emotion", "neutral"),
@@ -142,14 +137,15 @@ class AudioStreamSimulator:
         chunk_bytes = int(
             self.sample_rate * self.chunk_duration_ms / 1000
         ) * self.sample_width
+        interval = self.chunk_duration_ms / 1000
+        sample_rate = self.sample_rate
         for i in range(0, len(raw_audio), chunk_bytes):
-            chunk_data = raw_audio[i : i + chunk_bytes]
             yield AudioChunk(
-                data=chunk_data,
+                data=raw_audio[i : i + chunk_bytes],
                 timestamp=self._now(),
-                sample_rate=self.sample_rate,
+                sample_rate=sample_rate,
             )
-            await asyncio.sleep(self.chunk_duration_ms / 1000)
+            await asyncio.sleep(interval)
 
     # -- speech style transforms ---------------------------------------------
 
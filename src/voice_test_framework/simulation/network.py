@@ -4,11 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import random
+from dataclasses import dataclass
 from typing import Any
 
 from ..core.interfaces import AudioChunk
 
 
+@dataclass(frozen=True, slots=True)
+class _Profile:
+    """Named network condition preset (latency/jitter in ms, loss in [0, 1])."""
+
+    latency: float
+    jitter: float
+    loss: float
+
+
 class NetworkSimulator:
     """
     Simulate realistic network conditions that affect audio streaming.
@@ -17,12 +27,12 @@ class NetworkSimulator:
     packet loss, and bandwidth limits.
     """
 
-    PROFILES: dict[str, dict[str, Any]] = {
-        "perfect":   {"latency": 10,  "jitter": 2,   "loss": 0.0},
-        "good_4g":   {"latency": 50,  "jitter": 15,  "loss": 0.01},
-        "poor_4g":   {"latency": 150, "jitter": 50,  "loss": 0.05},
-        "bad_wifi":  {"latency": 200, "jitter": 100, "loss": 0.10},
-        "elevator":  {"latency": 500, "jitter": 200, "loss": 0.30},
+    PROFILES: dict[str, _Profile] = {
+        "perfect":   _Profile(latency=10.0,  jitter=2.0,   loss=0.0),
+        "good_4g":   _Profile(latency=50.0,  jitter=15.0,  loss=0.01),
+        "poor_4g":   _Profile(latency=150.0, jitter=50.0,  loss=0.05),
+        "bad_wifi":  _Profile(latency=200.0, jitter=100.0, loss=0.10),
+        "elevator":  _Profile(latency=500.0, jitter=200.0, loss=0.30),
     }
 
     def __init__(
@@ -34,10 +44,11 @@ class NetworkSimulator:
         bandwidth_limit: int | None = None,
     ):
         p = self.PROFILES.get(profile, self.PROFILES["perfect"])
-        self.base_latency = latency_ms if latency_ms is not None else p["latency"]
-        self.jitter = jitter_ms if jitter_ms is not None else p["jitter"]
-        self.loss_rate = loss_rate if loss_rate is not None else p["loss"]
+        self.base_latency = float(latency_ms) if latency_ms is not None else p.latency
+        self.jitter = float(jitter_ms) if jitter_ms is not None else p.jitter
+        self.loss_rate = float(loss_rate) if loss_rate is not None else p.loss
         self.bandwidth_limit = bandwidth_limit
+        self._defaults = (self.base_latency, self.jitter, self.loss_rate)
         self.is_connected = True
         self._clock: Any = None
         self._buffer: list[AudioChunk] = []
@@ -49,11 +60,7 @@ class NetworkSimulator:
 
     def set_profile(self, profile: str) -> None:
         p = self.PROFILES.get(profile, self.PROFILES["perfect"])
-        self.configure(
-            latency_ms=p["latency"],
-            jitter_ms=p["jitter"],
-            loss_rate=p["loss"],
-        )
+        self.configure(latency_ms=p.latency, jitter_ms=p.jitter, loss_rate=p.loss)
 
     def configure(
         self,
@@ -62,11 +69,17 @@ class NetworkSimulator:
         loss_rate: float | None = None,
     ) -> None:
         if latency_ms is not None:
-            self.base_latency = latency_ms
+            self.base_latency = float(latency_ms)
         if jitter_ms is not None:
-            self.jitter = jitter_ms
+            self.jitter = float(jitter_ms)
         if loss_rate is not None:
-            self.loss_rate = loss_rate
+            self.loss_rate = float(loss_rate)
+
+    def reset(self) -> None:
+        """Restore the construction-time conditions and reconnect."""
+        self.base_latency, self.jitter, self.loss_rate = self._defaults
+        self.is_connected = True
+        self._buffer.clear()
 
     # -- main API ------------------------------------------------------------
 
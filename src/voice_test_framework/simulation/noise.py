@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import random
 from dataclasses import dataclass, field
 from typing import Any
@@ -30,31 +32,89 @@ class TransientNoise:
 
     def next_chunk(self, chunk_samples: int) -> np.ndarray:
         """Generate the next chunk of transient noise."""
-        if not self.is_active():
-            return np.zeros(chunk_samples, dtype=np.int16)
-        amplitude = int(10 ** (self.peak_db / 20) * 32767)
-        freq = 800 + hash(self.source) % 400
-        t = np.arange(chunk_samples) / self._sr + self._elapsed
-        self._elapsed += chunk_samples / self._sr
-        return (np.sin(2 * np.pi * freq * t) * amplitude).astype(np.int16)
+        return self.next_batch(1, chunk_samples)[0]
+
+    def next_batch(self, num_chunks: int, chunk_samples: int) -> np.ndarray:
+        """Generate the next *num_chunks* chunks in a single vectorised pass.
+
+        Returns an ``(num_chunks, chunk_samples)`` array; rows past the end
+        of the event are silent, exactly as repeated ``next_chunk`` calls.
+        """
+        out = np.zeros((num_chunks, chunk_samples), dtype=np.int16)
+        step = chunk_samples / self._sr
+        start = self._elapsed
+        active = 0
+        while active < num_chunks and self._elapsed < self.duration:
+            self._elapsed += step
+            active += 1
+        if active:
+            amplitude = int(10 ** (self.peak_db / 20) * 32767)
+            freq = 800 + hash(self.source) % 400
+            t = np.arange(active * chunk_samples) / self._sr + start
+            wave = (np.sin(2 * np.pi * freq * t) * amplitude).astype(np.int16)
+            out[:active] = wave.reshape(active, chunk_samples)
+        return out
+
+
+_AMBIENT_POOL_SAMPLES = 1 << 16  # ~4 s at 16 kHz
+
+
+def _new_rng() -> np.random.Generator:
+    """SFC64 is cheaper per draw than the default PCG64."""
+    return np.random.Generator(np.random.SFC64())
 
 
 @dataclass
 class AmbientProfile:
-    """Continuous ambient noise profile."""
+    """Continuous ambient noise profile.
+
+    Noise is drawn in bulk into a pool and streamed out as views, so most
+    chunks cost no allocation. The pool is redrawn whenever it is used up or
+    ``snr_db`` changes, so long runs never hear the same noise loop.
+    """
 
     name: str
     snr_db: float
     _sr: int = 16000
     _phase: float = 0.0
+    _pool: np.ndarray | None = field(default=None, repr=False)
+    _pool_snr: float | None = field(default=None, repr=False)
+    _pos: int = 0
+    _rng: np.random.Generator = field(default_factory=_new_rng, repr=False)
 
     def next_chunk(self, chunk_samples: int) -> np.ndarray:
-        """Generate continuous ambient noise."""
-        amplitude = int(10 ** (-abs(self.snr_db) / 20) * 32767)
-        noise = np.random.default_rng().integers(
-            -amplitude, amplitude, size=chunk_samples, dtype=np.int16
-        )
-        return noise
+        """Generate continuous ambient noise (treat the result as read-only)."""
+        if (
+            self._pool is None
+            or self._pool_snr != self.snr_db
+            or self._pos >= _AMBIENT_POOL_SAMPLES
+        ):
+            self._refill()
+        if chunk_samples > _AMBIENT_POOL_SAMPLES:
+            # Larger than the pool: draw directly so nothing repeats in it
+            return self._draw(chunk_samples)
+        start = self._pos
+        end = start + chunk_samples
+        if end <= _AMBIENT_POOL_SAMPLES:
+            self._pos = end
+            return self._pool[start:end]
+        # Straddles the end: finish this pool and continue into a fresh one.
+        # Refilling rebinds ``_pool``, so views already handed out stay intact.
+        tail = self._pool[start:]
+        self._refill()
+        self._pos = end - _AMBIENT_POOL_SAMPLES
+        return np.concatenate((tail, self._pool[: self._pos]))
+
+    def _draw(self, num_samples: int, snr_db: float | None = None) -> np.ndarray:
+        snr = self.snr_db if snr_db is None else snr_db
+        amplitude = int(10 ** (-abs(snr) / 20) * 32767)
+        return self._rng.integers(-amplitude, amplitude, size=num_samples, dtype=np.int16)
+
+    def _refill(self) -> None:
+        snr = self.snr_db  # read once; set_snr may change it mid-refill
+        self._pool = self._draw(_AMBIENT_POOL_SAMPLES, snr)
+        self._pool_snr = snr
+        self._pos = 0
 
 
 # ---------------------------------------------------------------------------
@@ -97,51 +157,113 @@ class NoiseEngine:
         sample_rate: int = 16000,
     ):
         self.sample_rate = sample_rate
-        self.active_transients: list[TransientNoise] = []
+        # (end stream time, insertion seq, transient) min-heap
+        self._active_heap: list[tuple[float, int, TransientNoise]] = []
+        self._seq = 0  # tie-breaker for transients ending together
+        self._stream_time = 0.0  # seconds of audio mixed so far
+        self._rng = _new_rng()  # shared by every ambient profile this engine makes
+        # Held across each async mix (which may run in a worker thread) and by
+        # inject, so transients are never added mid-mix.  Setters below only
+        # rebind state and take effect from the next mix; nothing on the event
+        # loop ever blocks on the worker.
+        self._mix_lock = asyncio.Lock()
         self._clock: Any = None
 
         resolved_snr = snr_db if snr_db is not None else self.AMBIENT_PROFILES.get(
             profile, {}
         ).get("snr_db", 40)
-        self.ambient = AmbientProfile(name=profile, snr_db=resolved_snr, _sr=sample_rate)
+        self.ambient = AmbientProfile(
+            name=profile, snr_db=resolved_snr, _sr=sample_rate, _rng=self._rng
+        )
+        self._default_ambient = (profile, resolved_snr)
 
     def set_clock(self, clock: Any) -> None:
         self._clock = clock
 
+    @property
+    def active_transients(self) -> list[TransientNoise]:
+        """Transient noises currently mixed into the speech stream."""
+        return [t for _, _, t in self._active_heap]
+
     # -- public API ----------------------------------------------------------
 
     def set_profile(self, profile: str, snr_override: float | None = None) -> None:
         snr = snr_override if snr_override is not None else self.AMBIENT_PROFILES.get(
             profile, {}
         ).get("snr_db", 40)
-        self.ambient = AmbientProfile(name=profile, snr_db=snr, _sr=self.sample_rate)
+        self.ambient = AmbientProfile(
+            name=profile, snr_db=snr, _sr=self.sample_rate, _rng=self._rng
+        )
 
     def set_snr(self, snr_db: float) -> None:
         self.ambient.snr_db = snr_db
 
+    def reset(self) -> None:
+        """Restore the construction-time profile and drop active transients."""
+        profile, snr = self._default_ambient
+        self.ambient = AmbientProfile(
+            name=profile, snr_db=snr, _sr=self.sample_rate, _rng=self._rng
+        )
+        # Rebind rather than clear: an in-flight async mix keeps the old heap
+        self._active_heap = []
+        self._stream_time = 0.0
+
     def mix_with_speech(self, speech_chunk: AudioChunk) -> AudioChunk:
         """Mix noise into a speech audio chunk."""
-        speech = np.frombuffer(speech_chunk.data, dtype=np.int16)
-        num_samples = len(speech)
-
-        ambient_noise = self.ambient.next_chunk(num_samples)
-
-        layers: list[np.ndarray] = [speech.astype(np.float32), ambient_noise.astype(np.float32)]
-
-        # Add active transient noises
-        self.active_transients = [t for t in self.active_transients if t.is_active()]
-        for transient in self.active_transients:
-            layers.append(transient.next_chunk(num_samples).astype(np.float32))
-
-        mixed = sum(layers)  # type: ignore[arg-type]
-        mixed = np.clip(mixed, -32768, 32767).astype(np.int16)
+        self._check_no_async_mix()
+        return self._mix_chunk(speech_chunk)
 
+    def _mix_chunk(self, speech_chunk: AudioChunk) -> AudioChunk:
+        speech = np.frombuffer(speech_chunk.data, dtype=np.int16)
+        mixed = self._mix(speech.reshape(1, -1))
         return AudioChunk(
             data=mixed.tobytes(),
             timestamp=speech_chunk.timestamp,
             sample_rate=speech_chunk.sample_rate,
         )
 
+    def mix_batch(self, speech_chunks: list[AudioChunk]) -> list[AudioChunk]:
+        """Mix noise into a run of consecutive speech chunks in one pass.
+
+        Equal-sized chunks are mixed as a single ``(chunks, samples)`` block so
+        noise generation is vectorised across the whole run; mixed sizes fall
+        back to per-chunk :meth:`mix_with_speech`.
+        """
+        self._check_no_async_mix()
+        if len({len(c.data) for c in speech_chunks}) > 1:
+            return [self._mix_chunk(c) for c in speech_chunks]
+        if not speech_chunks:
+            return []
+
+        speech = np.frombuffer(
+            b"".join(c.data for c in speech_chunks), dtype=np.int16
+        ).reshape(len(speech_chunks), -1)
+        mixed = self._mix(speech)
+        return [
+            AudioChunk(
+                data=row.tobytes(),
+                timestamp=chunk.timestamp,
+                sample_rate=chunk.sample_rate,
+            )
+            for row, chunk in zip(mixed, speech_chunks)
+        ]
+
+    async def mix_with_speech_async(
+        self, speech_chunk: AudioChunk, *, threshold_samples: int = 4096
+    ) -> AudioChunk:
+        """Async variant of :meth:`mix_with_speech`.
+
+        Chunks of at least *threshold_samples* samples are mixed in a worker
+        thread so heavy numpy work does not stall the event loop; smaller
+        chunks are mixed inline to avoid the thread hand-off cost.  Concurrent
+        calls are serialised on an ``asyncio.Lock``, so waiting never blocks
+        the loop; don't call the synchronous mixers while one is in flight.
+        """
+        async with self._mix_lock:
+            if len(speech_chunk.data) >= threshold_samples * speech_chunk.sample_width:
+                return await asyncio.to_thread(self._mix_chunk, speech_chunk)
+            return self._mix_chunk(speech_chunk)
+
     async def inject(self, noise_type: str, source: str | None = None) -> None:
         """Inject a transient noise event or competing speech."""
         if noise_type == "transient" and source is not None:
@@ -152,7 +274,8 @@ class NoiseEngine:
                 peak_db=config["peak_db"],
                 _sr=self.sample_rate,
             )
-            self.active_transients.append(event)
+            async with self._mix_lock:
+                self._add_transient(event)
         elif noise_type == "competing_speech":
             # Simulate background speech as a mid-frequency transient
             event = TransientNoise(
@@ -161,7 +284,8 @@ class NoiseEngine:
                 peak_db=-10,
                 _sr=self.sample_rate,
             )
-            self.active_transients.append(event)
+            async with self._mix_lock:
+                self._add_transient(event)
 
     def crossfade_profile(
         self, from_profile: str, to_profile: str, duration: float = 3.0
@@ -170,3 +294,38 @@ class NoiseEngine:
         # For simplicity, snap to the target profile immediately.
         # A production implementation would interpolate SNR over *duration*.
         self.set_profile(to_profile)
+
+    # -- internals -----------------------------------------------------------
+
+    def _mix(self, speech: np.ndarray) -> np.ndarray:
+        """Mix all noise layers into ``(chunks, samples)`` int16 *speech*.
+
+        Layers are summed in a per-call int32 accumulator (calls may run in
+        worker threads), then saturated back to int16.
+        """
+        num_chunks, chunk_samples = speech.shape
+        total = speech.size
+        ambient = self.ambient.next_chunk(total).reshape(num_chunks, chunk_samples)
+        mixed = np.add(speech, ambient, dtype=np.int32)
+
+        # Drop expired transients; the earliest-ending one is always on top
+        heap = self._active_heap
+        while heap and not heap[0][2].is_active():
+            heapq.heappop(heap)
+        for _, _, transient in heap:
+            mixed += transient.next_batch(num_chunks, chunk_samples)
+        self._stream_time += total / self.sample_rate
+
+        np.clip(mixed, -32768, 32767, out=mixed)
+        return mixed.astype(np.int16)
+
+    def _add_transient(self, transient: TransientNoise) -> None:
+        self._seq += 1
+        end = self._stream_time + transient.duration
+        heapq.heappush(self._active_heap, (end, self._seq, transient))
+
+    def _check_no_async_mix(self) -> None:
+        if self._mix_lock.locked():
+            raise RuntimeError(
+                "synchronous mix while mix_with_speech_async is in flight"
+            )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from .noise import NoiseEngine
 
@@ -79,6 +79,17 @@ class PhysicalWorldSimulator:
 
     def __init__(self) -> None:
         self._clock: Any = None
+        # ``affects`` value -> handler, resolved once instead of per event
+        self._handlers: dict[str, Callable[..., Awaitable[str]]] = {
+            "audio_quality_change": self._handle_audio_quality_change,
+            "brief_audio_gap": self._handle_brief_audio_gap,
+            "ambient_noise_change": self._handle_ambient_noise_change,
+            "transient_noise": self._handle_transient_noise,
+            "competing_speech": self._handle_competing_speech,
+            "background_noise": self._handle_background_noise,
+            "mic_movement": self._handle_mic_movement,
+            "screen_content_change": self._handle_screen_content_change,
+        }
 
     def set_clock(self, clock: Any) -> None:
         self._clock = clock
@@ -113,56 +124,77 @@ class PhysicalWorldSimulator:
         noise_engine: NoiseEngine | None,
     ) -> str:
         affects = event.get("affects", "")
+        handler = self._handlers.get(affects, self._handle_unknown)
+        return await handler(event, audio_sim, noise_engine)
 
-        match affects:
-            case "audio_quality_change":
-                # Switching to speaker introduces echo
-                if audio_sim is not None and hasattr(audio_sim, "enable_echo"):
-                    audio_sim.enable_echo(delay_ms=150, decay=0.3)
-                return "echo_enabled"
-
-            case "brief_audio_gap":
-                gap_ms = event.get("gap_ms", 500)
-                await asyncio.sleep(gap_ms / 1000)
-                return f"audio_gap_{gap_ms}ms"
-
-            case "ambient_noise_change":
-                if noise_engine is not None:
-                    transition = event.get("transition")
-                    if transition:
-                        from_profile, to_profile = transition
-                        noise_engine.crossfade_profile(
-                            from_profile,
-                            to_profile,
-                            duration=event.get("transition_duration_s", 3),
-                        )
-                    return "noise_profile_changed"
-                return "no_noise_engine"
-
-            case "transient_noise":
-                if noise_engine is not None:
-                    await noise_engine.inject("transient", event.get("type", "notification"))
-                    return "transient_injected"
-                return "no_noise_engine"
-
-            case "competing_speech":
-                if noise_engine is not None:
-                    await noise_engine.inject("competing_speech")
-                    return "competing_speech_injected"
-                return "no_noise_engine"
-
-            case "background_noise":
-                if noise_engine is not None:
-                    await noise_engine.inject("transient", "keyboard")
-                    return "keyboard_noise_injected"
-                return "no_noise_engine"
-
-            case "mic_movement":
-                # Simulate brief audio artefacts from physical movement
-                return "mic_movement_simulated"
-
-            case "screen_content_change":
-                return "screen_content_changed"
-
-            case _:
-                return f"unknown_effect_{affects}"
+    # -- event handlers ------------------------------------------------------
+
+    async def _handle_audio_quality_change(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        # Switching to speaker introduces echo
+        if audio_sim is not None and hasattr(audio_sim, "enable_echo"):
+            audio_sim.enable_echo(delay_ms=150, decay=0.3)
+        return "echo_enabled"
+
+    async def _handle_brief_audio_gap(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        gap_ms = event.get("gap_ms", 500)
+        await asyncio.sleep(gap_ms / 1000)
+        return f"audio_gap_{gap_ms}ms"
+
+    async def _handle_ambient_noise_change(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        if noise_engine is None:
+            return "no_noise_engine"
+        transition = event.get("transition")
+        if transition:
+            from_profile, to_profile = transition
+            noise_engine.crossfade_profile(
+                from_profile,
+                to_profile,
+                duration=event.get("transition_duration_s", 3),
+            )
+        return "noise_profile_changed"
+
+    async def _handle_transient_noise(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        if noise_engine is None:
+            return "no_noise_engine"
+        await noise_engine.inject("transient", event.get("type", "notification"))
+        return "transient_injected"
+
+    async def _handle_competing_speech(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        if noise_engine is None:
+            return "no_noise_engine"
+        await noise_engine.inject("competing_speech")
+        return "competing_speech_injected"
+
+    async def _handle_background_noise(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        if noise_engine is None:
+            return "no_noise_engine"
+        await noise_engine.inject("transient", "keyboard")
+        return "keyboard_noise_injected"
+
+    async def _handle_mic_movement(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        # Simulate brief audio artefacts from physical movement
+        return "mic_movement_simulated"
+
+    async def _handle_screen_content_change(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        return "screen_content_changed"
+
+    async def _handle_unknown(
+        self, event: dict[str, Any], audio_sim: Any | None, noise_engine: NoiseEngine | None
+    ) -> str:
+        return f"unknown_effect_{event.get('affects', '')}"
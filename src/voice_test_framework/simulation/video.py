@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, AsyncIterator
 
 import numpy as np
@@ -32,14 +33,10 @@ class CameraSimGenerator:
         resolution: tuple[int, int] = (1280, 720),
         num_frames: int = 1,
     ) -> list[bytes]:
-        w, h = resolution
-        frames: list[bytes] = []
-        for _ in range(num_frames):
-            # Generate a deterministic colour based on scene name
-            colour_seed = hash(scene) % 256
-            frame = np.full((h, w, 3), colour_seed, dtype=np.uint8)
-            frames.append(frame.tobytes())
-        return frames
+        # Generate a deterministic colour based on scene name; frames are
+        # static, so render once and share the buffer.
+        colour_seed = hash(scene) % 256
+        return [_solid_frame(colour_seed, resolution)] * num_frames
 
 
 class ScreenShareGenerator:
@@ -54,12 +51,7 @@ class ScreenShareGenerator:
         resolution: tuple[int, int] = (1280, 720),
         num_frames: int = 1,
     ) -> list[bytes]:
-        w, h = resolution
-        frames: list[bytes] = []
-        for _ in range(num_frames):
-            frame = np.full((h, w, 3), 40, dtype=np.uint8)  # dark background
-            frames.append(frame.tobytes())
-        return frames
+        return [_solid_frame(40, resolution)] * num_frames  # dark background
 
 
 class DocumentScanGenerator:
@@ -71,12 +63,7 @@ class DocumentScanGenerator:
         resolution: tuple[int, int] = (1280, 720),
         num_frames: int = 1,
     ) -> list[bytes]:
-        w, h = resolution
-        frames: list[bytes] = []
-        for _ in range(num_frames):
-            frame = np.full((h, w, 3), 240, dtype=np.uint8)  # white page
-            frames.append(frame.tobytes())
-        return frames
+        return [_solid_frame(240, resolution)] * num_frames  # white page
 
 
 class VideoStreamSimulator:
@@ -162,12 +149,17 @@ def _static_frames(
     resolution: tuple[int, int],
 ) -> list[bytes]:
     """Load an image file and repeat it as static video frames."""
-    w, h = resolution
     try:
         with open(path, "rb") as fh:
             data = fh.read()
         # For simplicity, use the raw bytes repeated per-frame
         return [data] * int(fps * duration)
     except FileNotFoundError:
-        placeholder = np.full((h, w, 3), 128, dtype=np.uint8).tobytes()
-        return [placeholder] * int(fps * duration)
+        return [_solid_frame(128, resolution)] * int(fps * duration)
+
+
+@lru_cache(maxsize=8)
+def _solid_frame(value: int, resolution: tuple[int, int]) -> bytes:
+    """Raw RGB24 frame filled with *value*, rendered once per colour/size."""
+    w, h = resolution
+    return np.full((h, w, 3), value, dtype=np.uint8).tobytes()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
+from ..core.results import ToolCallRecord
 from .registry import MockToolRegistry
 
 
@@ -17,7 +18,7 @@ class ToolCallAsserter:
         self.registry = registry
 
     @property
-    def call_log(self) -> list[dict[str, Any]]:
+    def call_log(self) -> Sequence[ToolCallRecord]:
         return self.registry.call_log
 
     def assert_called(
@@ -27,79 +28,82 @@ class ToolCallAsserter:
         within_ms: int = 5000,
     ) -> None:
         """Assert that *tool_name* was called (optionally with matching args)."""
-        calls = [c for c in self.call_log if c["tool"] == tool_name]
+        calls = self.registry._by_tool.get(tool_name, ())
         if not calls:
             raise AssertionError(
                 f"Expected '{tool_name}' to be called, "
                 f"but it wasn't.  Call log: {self.call_log}"
             )
-        if args_contain:
-            last_call = calls[-1]
+        last_call = calls[-1]
+        # Items views compare by key lookup + value equality in C, so this
+        # also works for unhashable values; walk the keys only to report.
+        if args_contain and not args_contain.items() <= last_call.args.items():
             for key, value in args_contain.items():
-                if key not in last_call["args"]:
+                if key not in last_call.args:
                     raise AssertionError(
                         f"Missing arg '{key}' in {tool_name} call.  "
-                        f"Got: {last_call['args']}"
+                        f"Got: {last_call.args}"
                     )
-                if last_call["args"][key] != value:
+                if last_call.args[key] != value:
                     raise AssertionError(
                         f"Arg '{key}' mismatch: expected {value!r}, "
-                        f"got {last_call['args'][key]!r}"
+                        f"got {last_call.args[key]!r}"
                     )
 
     def assert_not_called(self, tool_name: str) -> None:
         """Assert that *tool_name* was **not** called."""
-        calls = [c for c in self.call_log if c["tool"] == tool_name]
-        if calls:
+        count = self.registry._counts.get(tool_name, 0)
+        if count:
             raise AssertionError(
                 f"Expected '{tool_name}' NOT to be called, "
-                f"but it was called {len(calls)} time(s)"
+                f"but it was called {count} time(s)"
+            )
+
+    def assert_none_called(self, *tool_names: str) -> None:
+        """Assert that none of *tool_names* were called."""
+        called = self.registry._by_tool.keys() & frozenset(tool_names)
+        if called:
+            raise AssertionError(
+                f"Expected none of {tool_names} to be called, "
+                f"but {sorted(called)} were"
             )
 
     def assert_call_order(self, *tool_names: str) -> None:
         """Assert that tools were called in the specified order."""
-        actual_order = [c["tool"] for c in self.call_log]
-        idx = 0
-        for expected in tool_names:
-            found = False
-            while idx < len(actual_order):
-                if actual_order[idx] == expected:
-                    found = True
-                    idx += 1
-                    break
-                idx += 1
-            if not found:
-                raise AssertionError(
-                    f"Expected call order {tool_names}, "
-                    f"but actual order was {actual_order}"
-                )
+        # ``in`` on a shared iterator consumes it up to each match, so this is
+        # a single forward pass checking *tool_names* is a subsequence.
+        # Fail fast on a tool that was never called, without scanning the log.
+        counts = self.registry._counts
+        remaining = iter(self.registry._tool_sequence)
+        if not all(name in counts for name in tool_names) or not all(
+            expected in remaining for expected in tool_names
+        ):
+            raise AssertionError(
+                f"Expected call order {tool_names}, "
+                f"but actual order was {list(self.registry._tool_sequence)}"
+            )
 
     def assert_retry_on_failure(
         self, tool_name: str, max_retries: int = 3
     ) -> None:
         """Assert the SUT retried *tool_name* after failures."""
-        calls = [c for c in self.call_log if c["tool"] == tool_name]
-        if len(calls) < 2:
+        count = self.registry._counts.get(tool_name, 0)
+        if count < 2:
             raise AssertionError(
                 f"Expected '{tool_name}' to be retried, "
-                f"but it was only called {len(calls)} time(s)"
+                f"but it was only called {count} time(s)"
             )
-        if len(calls) > max_retries + 1:
+        if count > max_retries + 1:
             raise AssertionError(
-                f"'{tool_name}' was called {len(calls)} times, "
+                f"'{tool_name}' was called {count} times, "
                 f"exceeding max retries ({max_retries})"
             )
 
     def assert_called_times(self, tool_name: str, times: int) -> None:
         """Assert *tool_name* was called exactly *times* times."""
-        calls = [c for c in self.call_log if c["tool"] == tool_name]
-        if len(calls) != times:
+        count = self.registry._counts.get(tool_name, 0)
+        if count != times:
             raise AssertionError(
                 f"Expected '{tool_name}' to be called {times} time(s), "
-                f"but it was called {len(calls)} time(s)"
+                f"but it was called {count} time(s)"
             )
-
-
-class AssertionError(AssertionError):
-    """Custom assertion error with nicer formatting."""
-    pass
@@ -2,130 +2,122 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from .registry import MockToolRegistry
-
-
-def register_hotel_booking_mocks(registry: MockToolRegistry) -> None:
-    """Register a set of mock tools for the hotel booking scenario."""
-
-    registry.register(
-        "check_availability",
+from .registry import MockToolRegistry, ToolMock
+
+# ---------------------------------------------------------------------------
+# Static response payloads
+#
+# Everything a handler returns that does not depend on its args is built once
+# here; handlers return a fresh top-level dict around these, so the nested
+# payloads are shared between calls.  Treat as read-only.
+# ---------------------------------------------------------------------------
+
+_AVAILABILITY = {
+    "available": True,
+    "rooms": [
+        {"type": "Standard Room", "price": 399},
+        {"type": "King Room", "price": 499},
+        {"type": "Suite", "price": 899},
+    ],
+}
+_BOOKING_BASE = {"booking_id": "BK20240115001", "status": "confirmed"}
+_CANCELLATION_BASE = {"status": "cancelled", "refund": True}
+_BOOKING_DETAILS_BASE = {
+    "status": "confirmed",
+    "room_type": "King Room",
+    "checkin": "2024-01-19",
+    "nights": 2,
+    "price_total": 998,
+}
+_LONG_SEARCH = {
+    "results": [
+        {"hotel": "Grand Hotel", "distance": "0.5km", "price": 599},
+        {"hotel": "City Inn", "distance": "1.2km", "price": 299},
+    ],
+}
+_WEATHER_BASE = {"temperature": 22, "condition": "sunny", "humidity": 45}
+_WEB_RESULTS = [
+    {"title": "Result 1", "snippet": "Some information..."},
+    {"title": "Result 2", "snippet": "More information..."},
+]
+_REMINDER_BASE = {"reminder_id": "REM001", "status": "set"}
+_CALENDAR_EVENTS = [
+    {"time": "09:00", "title": "Team standup"},
+    {"time": "14:00", "title": "Project review"},
+]
+
+
+# Built once at import and shared by every registry.  Safe because ToolMock is
+# frozen: a registry that needs a variant registers its own replaced copy.
+_HOTEL_BOOKING_MOCKS: dict[str, ToolMock] = {
+    "check_availability": ToolMock(
+        handler=lambda args: dict(_AVAILABILITY),
+        latency=(200, 800),
+    ),
+    "create_booking": ToolMock(
         handler=lambda args: {
-            "available": True,
-            "rooms": [
-                {"type": "Standard Room", "price": 399},
-                {"type": "King Room", "price": 499},
-                {"type": "Suite", "price": 899},
-            ],
-        },
-        latency_ms=(200, 800),
-    )
-
-    registry.register(
-        "create_booking",
-        handler=lambda args: {
-            "booking_id": "BK20240115001",
-            "status": "confirmed",
+            **_BOOKING_BASE,
             "checkin": args.get("checkin", ""),
             "nights": args.get("nights", 1),
         },
-        latency_ms=(500, 2000),
+        latency=(500, 2000),
         failure_rate=0.1,
-    )
-
-    registry.register(
-        "cancel_booking",
-        handler=lambda args: {
-            "booking_id": args.get("booking_id", ""),
-            "status": "cancelled",
-            "refund": True,
-        },
-        latency_ms=(300, 1000),
-    )
-
-    registry.register(
-        "get_booking_details",
+    ),
+    "cancel_booking": ToolMock(
+        handler=lambda args: {"booking_id": args.get("booking_id", ""), **_CANCELLATION_BASE},
+        latency=(300, 1000),
+    ),
+    "get_booking_details": ToolMock(
         handler=lambda args: {
             "booking_id": args.get("booking_id", "BK20240115001"),
-            "status": "confirmed",
-            "room_type": "King Room",
-            "checkin": "2024-01-19",
-            "nights": 2,
-            "price_total": 998,
+            **_BOOKING_DETAILS_BASE,
         },
-        latency_ms=(100, 400),
-    )
-
-    registry.register(
-        "long_running_search",
-        handler=lambda args: {
-            "results": [
-                {"hotel": "Grand Hotel", "distance": "0.5km", "price": 599},
-                {"hotel": "City Inn", "distance": "1.2km", "price": 299},
-            ],
-        },
-        latency_ms=(3000, 8000),  # deliberately slow
-    )
-
-
-def register_general_mocks(registry: MockToolRegistry) -> None:
-    """Register general-purpose mock tools."""
-
-    registry.register(
-        "get_weather",
-        handler=lambda args: {
-            "location": args.get("location", "Beijing"),
-            "temperature": 22,
-            "condition": "sunny",
-            "humidity": 45,
-        },
-        latency_ms=(100, 300),
-    )
-
-    registry.register(
-        "search_web",
-        handler=lambda args: {
-            "query": args.get("query", ""),
-            "results": [
-                {"title": "Result 1", "snippet": "Some information..."},
-                {"title": "Result 2", "snippet": "More information..."},
-            ],
-        },
-        latency_ms=(500, 1500),
-    )
-
-    registry.register(
-        "send_email",
+        latency=(100, 400),
+    ),
+    "long_running_search": ToolMock(
+        handler=lambda args: dict(_LONG_SEARCH),
+        latency=(3000, 8000),  # deliberately slow
+    ),
+}
+
+_GENERAL_MOCKS: dict[str, ToolMock] = {
+    "get_weather": ToolMock(
+        handler=lambda args: {"location": args.get("location", "Beijing"), **_WEATHER_BASE},
+        latency=(100, 300),
+    ),
+    "search_web": ToolMock(
+        handler=lambda args: {"query": args.get("query", ""), "results": _WEB_RESULTS},
+        latency=(500, 1500),
+    ),
+    "send_email": ToolMock(
         handler=lambda args: {
             "status": "sent",
             "to": args.get("to", ""),
             "subject": args.get("subject", ""),
         },
-        latency_ms=(200, 600),
+        latency=(200, 600),
         failure_rate=0.05,
-    )
-
-    registry.register(
-        "set_reminder",
+    ),
+    "set_reminder": ToolMock(
         handler=lambda args: {
-            "reminder_id": "REM001",
+            **_REMINDER_BASE,
             "time": args.get("time", ""),
             "message": args.get("message", ""),
-            "status": "set",
         },
-        latency_ms=(50, 200),
-    )
+        latency=(50, 200),
+    ),
+    "get_calendar": ToolMock(
+        handler=lambda args: {"date": args.get("date", "today"), "events": _CALENDAR_EVENTS},
+        latency=(100, 400),
+    ),
+}
 
-    registry.register(
-        "get_calendar",
-        handler=lambda args: {
-            "date": args.get("date", "today"),
-            "events": [
-                {"time": "09:00", "title": "Team standup"},
-                {"time": "14:00", "title": "Project review"},
-            ],
-        },
-        latency_ms=(100, 400),
-    )
+
+def register_hotel_booking_mocks(registry: MockToolRegistry) -> None:
+    """Register a set of mock tools for the hotel booking scenario."""
+    registry.register_mocks(_HOTEL_BOOKING_MOCKS)
+
+
+def register_general_mocks(registry: MockToolRegistry) -> None:
+    """Register general-purpose mock tools."""
+    registry.register_mocks(_GENERAL_MOCKS)
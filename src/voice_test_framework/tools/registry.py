@@ -3,22 +3,46 @@
 from __future__ import annotations
 
 import asyncio
-import random
+import inspect
+from asyncio import sleep as _sleep
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from random import random as _random
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, Sequence
 
 from ..core.interfaces import ToolResult
-from ..core.results import AssertionResult
+from ..core.results import AssertionResult, ToolCallRecord
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToolMock:
-    """Configuration for a single mock tool."""
+    """Configuration for a single mock tool.
+
+    Frozen so the derived fields below can't go stale; use
+    ``dataclasses.replace`` or ``MockToolRegistry.register`` to change a tool.
+    """
 
     handler: Callable[..., Any]
     latency: tuple[float, float] = (100, 500)  # ms range
     failure_rate: float = 0.0
     failure_error: str = "ServiceUnavailable"
+    # ``None`` = detect from the handler; pass True for sync callables that
+    # return awaitables, which are not detected.
+    is_async: bool | None = None
+
+    # Derived in __post_init__ so the hot path is a single multiply-add
+    lat_lo: float = field(init=False, repr=False)  # seconds
+    lat_span: float = field(init=False, repr=False)  # seconds
+    never_fails: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        lo, hi = self.latency
+        object.__setattr__(self, "lat_lo", lo / 1000.0)
+        object.__setattr__(self, "lat_span", (hi - lo) / 1000.0)
+        object.__setattr__(self, "never_fails", self.failure_rate == 0.0)
+        if self.is_async is None:
+            object.__setattr__(self, "is_async", _is_coroutine_callable(self.handler))
 
 
 class MockToolRegistry:
@@ -27,13 +51,34 @@ class MockToolRegistry:
 
     Key: simulates not only successes but also failures, latency, and
     partial results — the scenarios that matter most in production.
+
+    With *call_log_capacity* set, only the most recent calls are kept and
+    every assertion (including call order and counts) sees just that window.
     """
 
-    def __init__(self) -> None:
-        self.tools: dict[str, ToolMock] = {}
-        self.call_log: list[dict[str, Any]] = []
+    def __init__(self, call_log_capacity: int | None = None) -> None:
+        self._tools: dict[str, ToolMock] = {}
+        # Read-only view; add tools through ``register``
+        self.tools: Mapping[str, ToolMock] = MappingProxyType(self._tools)
+        self._capacity = call_log_capacity
+        self._call_log: list[ToolCallRecord] | deque[ToolCallRecord] = (
+            deque(maxlen=call_log_capacity) if call_log_capacity else []
+        )
+        # Read-only view; calls are logged only through ``handle_call``
+        self.call_log: Sequence[ToolCallRecord] = _CallLogView(self._call_log)
+        # ``_call_log`` stays the record-per-call source of truth; assertions
+        # read these side structures instead so they never walk the records:
+        #   _by_tool        tool name -> that tool's records, in call order
+        #   _tool_sequence  tool-name column of the log (call-order checks)
+        #   _counts         tool name -> number of retained calls
+        self._by_tool: dict[str, deque[ToolCallRecord]] = {}
+        self._tool_sequence: list[str] | deque[str] = (
+            deque(maxlen=call_log_capacity) if call_log_capacity else []
+        )
+        self._counts: dict[str, int] = {}
         self._clock: Any = None
-        self._pending_expectations: list[_ToolExpectation] = []
+        self._unknown_results: dict[str, ToolResult] = {}  # reused per unknown name
+        self._waiters: dict[str, list[asyncio.Future[ToolCallRecord | None]]] = {}
 
     def set_clock(self, clock: Any) -> None:
         self._clock = clock
@@ -52,44 +97,56 @@ class MockToolRegistry:
         latency_ms: tuple[float, float] = (100, 500),
         failure_rate: float = 0.0,
         failure_error: str = "ServiceUnavailable",
+        is_async: bool | None = None,
     ) -> None:
-        self.tools[name] = ToolMock(
+        self._tools[name] = ToolMock(
             handler=handler,
             latency=latency_ms,
             failure_rate=failure_rate,
             failure_error=failure_error,
+            is_async=is_async,
         )
 
+    def register_mocks(self, mocks: Mapping[str, ToolMock]) -> None:
+        """Register prebuilt mocks, e.g. a shared module-level set."""
+        self._tools.update(mocks)
+
     # -- invocation (called by the SUT adapter) ------------------------------
 
     async def handle_call(self, tool_name: str, args: dict[str, Any]) -> ToolResult:
         """Handle a tool call from the system under test."""
-        record = {
-            "tool": tool_name,
-            "args": args,
-            "timestamp": self._now(),
-        }
-        self.call_log.append(record)
-
-        # Notify any pending expectations
-        for exp in self._pending_expectations:
-            if exp.tool_name == tool_name:
-                exp.received.set()
-
-        mock = self.tools.get(tool_name)
+        record = ToolCallRecord(tool=tool_name, args=args, timestamp=self._now())
+        self._record(record)
+
+        # Wake anyone waiting on this tool, handing over the triggering call
+        for fut in self._waiters.get(tool_name, ()):
+            if not fut.done():
+                fut.set_result(record)
+
+        # Look up on the backing dict, not the read-only proxy in ``tools``
+        mock = self._tools.get(tool_name)
         if mock is None:
-            return ToolResult(
-                success=False,
-                error=f"Unknown tool: {tool_name}",
-                latency_ms=0,
-            )
+            record.success = False
+            result = self._unknown_results.get(tool_name)
+            if result is None:
+                result = self._unknown_results[tool_name] = ToolResult(
+                    success=False,
+                    error=f"Unknown tool: {tool_name}",
+                    latency_ms=0,
+                )
+            return result
 
         # Simulate network latency
-        latency = random.uniform(*mock.latency) / 1000
-        await asyncio.sleep(latency)
+        latency = mock.lat_lo + _random() * mock.lat_span
+        record.latency_ms = latency * 1000
+        # Under a simulated clock the latency is only reported: the clock is
+        # shared with the scenario timeline and only the orchestrator moves it.
+        if self._clock is None or self._clock.realtime:
+            await _sleep(latency)
 
-        # Simulate failure
-        if random.random() < mock.failure_rate:
+        # Simulate failure (most mocks never fail, so skip the draw)
+        if not mock.never_fails and _random() < mock.failure_rate:
+            record.success = False
             return ToolResult(
                 success=False,
                 error=mock.failure_error,
@@ -97,9 +154,10 @@ class MockToolRegistry:
             )
 
         # Invoke the handler
-        result = mock.handler(args)
-        if asyncio.iscoroutine(result):
-            result = await result
+        if mock.is_async:
+            result = await mock.handler(args)
+        else:
+            result = mock.handler(args)
 
         return ToolResult(
             success=True,
@@ -116,11 +174,15 @@ class MockToolRegistry:
         timeout: float = 5.0,
     ) -> AssertionResult:
         """Wait until a specific tool is called, or timeout."""
-        exp = _ToolExpectation(tool_name=tool_name)
-        self._pending_expectations.append(exp)
+        # Resolves to the triggering call, or to None if ``reset`` ran first
+        fut: asyncio.Future[ToolCallRecord | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        waiters = self._waiters.setdefault(tool_name, [])
+        waiters.append(fut)
 
         try:
-            await asyncio.wait_for(exp.received.wait(), timeout=timeout)
+            last_call = await asyncio.wait_for(fut, timeout=timeout)
         except asyncio.TimeoutError:
             return AssertionResult(
                 timestamp=self._now(),
@@ -129,42 +191,105 @@ class MockToolRegistry:
                 expected={"tool": tool_name, "args": expected_args},
             )
         finally:
-            self._pending_expectations.remove(exp)
+            waiters.remove(fut)
 
-        # Find the matching call
-        calls = [c for c in self.call_log if c["tool"] == tool_name]
-        if not calls:
+        if last_call is None:
             return AssertionResult(
                 timestamp=self._now(),
                 passed=False,
-                description=f"Tool '{tool_name}' was never called",
+                description=f"Registry reset while waiting for tool '{tool_name}'",
+                expected={"tool": tool_name, "args": expected_args},
             )
 
-        last_call = calls[-1]
         if expected_args is not None:
             for key, value in expected_args.items():
-                if key not in last_call["args"]:
+                if key not in last_call.args:
                     return AssertionResult(
                         timestamp=self._now(),
                         passed=False,
                         description=f"Missing arg '{key}' in {tool_name} call",
                         expected=expected_args,
-                        actual=last_call["args"],
+                        actual=last_call.args,
                     )
 
         return AssertionResult(
             timestamp=self._now(),
             passed=True,
             description=f"Tool '{tool_name}' called successfully",
-            actual=last_call["args"],
+            actual=last_call.args,
         )
 
     def reset(self) -> None:
-        """Clear the call log."""
-        self.call_log.clear()
+        """Clear the call log; pending ``wait_for_call`` waits fail."""
+        self._call_log.clear()
+        self._by_tool.clear()
+        self._tool_sequence.clear()
+        self._counts.clear()
+        self._unknown_results.clear()
+        for waiters in self._waiters.values():
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_result(None)
+        self._waiters.clear()
+
+    # -- internals -----------------------------------------------------------
+
+    def _record(self, record: ToolCallRecord) -> None:
+        tool_name = record.tool
+        if self._capacity and len(self._call_log) == self._capacity:
+            self._evict(self._call_log[0])
+        self._call_log.append(record)
+        self._tool_sequence.append(tool_name)
+        self._by_tool.setdefault(tool_name, deque()).append(record)
+        self._counts[tool_name] = self._counts.get(tool_name, 0) + 1
+
+    def _evict(self, oldest: ToolCallRecord) -> None:
+        """Drop *oldest* from the indexes; the deques drop it from the log."""
+        tool_name = oldest.tool
+        records = self._by_tool[tool_name]
+        records.popleft()
+        self._counts[tool_name] -= 1
+        if not records:
+            del self._by_tool[tool_name]
+            del self._counts[tool_name]
+
+
+class _CallLogView(Sequence[ToolCallRecord]):
+    """Read-only view of a registry's call log.
+
+    Mutating the log directly would desynchronise the per-tool indexes the
+    asserter reads, so only the registry appends to it.
+    """
+
+    __slots__ = ("_log",)
+
+    def __init__(self, log: list[ToolCallRecord] | deque[ToolCallRecord]) -> None:
+        self._log = log
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def __iter__(self) -> Iterator[ToolCallRecord]:
+        return iter(self._log)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return list(self._log)[index]  # deques don't slice
+        return self._log[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _CallLogView):
+            other = other._log
+        return isinstance(other, Sequence) and list(self._log) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self._log))
 
 
-@dataclass
-class _ToolExpectation:
-    tool_name: str
-    received: asyncio.Event = field(default_factory=asyncio.Event)
+def _is_coroutine_callable(handler: Callable[..., Any]) -> bool:
+    """True for ``async def`` functions and objects with ``async def __call__``."""
+    if inspect.iscoroutinefunction(handler):
+        return True
+    if inspect.isroutine(handler) or not callable(handler):
+        return False
+    return inspect.iscoroutinefunction(type(handler).__call__)
@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterator
+
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # not installed, or Windows
+    uvloop = None
+
 from voice_test_framework.core.orchestrator import ScenarioOrchestrator
 from voice_test_framework.simulation.audio import AudioStreamSimulator, AudioConfig
 from voice_test_framework.simulation.video import VideoStreamSimulator, VideoConfig
@@ -18,9 +31,60 @@ from voice_test_framework.tools.builtin_mocks import (
 from voice_test_framework.evaluation.framework import EvaluationFramework
 
 
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """Run async tests on libuv instead of the default selector loop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+# tmpfs, so report/baseline write-read cycles stay in memory
+_SHM = Path("/dev/shm")
+_test_failed = pytest.StashKey[bool]()
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(
+    item: pytest.Item, call: pytest.CallInfo[None]
+) -> Iterator[None]:
+    """Remember failures so ``tmp_path`` can keep the directory for inspection."""
+    report = yield
+    if report.failed:
+        item.stash[_test_failed] = True
+    return report
+
+
 @pytest.fixture
+def tmp_path(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[Path]:
+    """Per-test temp directory, placed on /dev/shm when it is writable.
+
+    A failed test's directory is kept for inspection unless
+    ``tmp_path_retention_policy`` is ``"none"``; passing tests always clean up,
+    since nothing prunes old runs on /dev/shm the way pytest's base temp is.
+    """
+    name = re.sub(r"\W", "_", request.node.name)[:30]
+    if not (_SHM.is_dir() and os.access(_SHM, os.W_OK)):
+        yield tmp_path_factory.mktemp(name, numbered=True)
+        return
+    path = Path(tempfile.mkdtemp(prefix=f"vtf-{name}-", dir=_SHM))
+    yield path
+    policy = request.config.getini("tmp_path_retention_policy")
+    failed = request.node.stash.get(_test_failed, False)
+    if policy == "none" or not failed:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
 def orchestrator() -> ScenarioOrchestrator:
-    """Return a fully-wired orchestrator with all simulation layers."""
+    """Return a fully-wired orchestrator with all simulation layers.
+
+    Built once per session; ``_reset_shared_fixtures`` resets it before
+    every test.
+    """
     orch = ScenarioOrchestrator()
 
     orch.register_layer(
@@ -31,12 +95,7 @@ def orchestrator() -> ScenarioOrchestrator:
     orch.register_layer("environment", NoiseEngine(profile="quiet_room"))
     orch.register_layer("network", NetworkSimulator(profile="perfect"))
     orch.register_layer("barge_in", BargeInSimulator())
-
-    tools = MockToolRegistry()
-    register_hotel_booking_mocks(tools)
-    register_general_mocks(tools)
-    orch.register_layer("tools", tools)
-
+    orch.register_layer("tools", _builtin_registry())
     orch.register_layer("eval", EvaluationFramework())
 
     return orch
@@ -44,7 +103,19 @@ def orchestrator() -> ScenarioOrchestrator:
 
 @pytest.fixture
 def tool_registry() -> MockToolRegistry:
-    """Return a standalone mock tool registry."""
+    """Return a fresh standalone mock tool registry."""
+    return _builtin_registry()
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_fixtures(orchestrator: ScenarioOrchestrator) -> None:
+    """Give every test a clean view of the session-scoped orchestrator."""
+    orchestrator.reset()
+    # Tests may register extra tools; a fresh registry is cheap to build
+    orchestrator.register_layer("tools", _builtin_registry())
+
+
+def _builtin_registry() -> MockToolRegistry:
     registry = MockToolRegistry()
     register_hotel_booking_mocks(registry)
     register_general_mocks(registry)
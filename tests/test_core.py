@@ -9,6 +9,7 @@ import pytest
 from voice_test_framework.core.clock import SimulatedClock
 from voice_test_framework.core.results import TestResults, AssertionResult, ToolCallResults
 from voice_test_framework.core.interfaces import AudioChunk, VideoFrame, ToolResult
+from voice_test_framework.core.orchestrator import ScenarioOrchestrator
 
 
 class TestSimulatedClock:
@@ -39,6 +40,21 @@ class TestSimulatedClock:
         assert clock.now() == 0.0
 
 
+class TestScenarioOrchestrator:
+
+    async def test_reset(self, orchestrator: ScenarioOrchestrator):
+        orchestrator.layers["environment"].set_snr(5)
+        await orchestrator.clock.advance_to(12.0)
+        orchestrator.scenario = {"timeline": []}
+        orchestrator.clock.set_realtime(True)
+        orchestrator.reset()
+        assert orchestrator.clock.now() == 0.0
+        assert not orchestrator.clock.realtime
+        assert orchestrator.scenario == {}
+        assert orchestrator.timeline.empty()
+        assert orchestrator.layers["environment"].ambient.snr_db == 40
+
+
 class TestTestResults:
 
     def test_all_passed(self):
@@ -53,6 +69,15 @@ class TestTestResults:
         r.add(1, AssertionResult(timestamp=1, passed=False))
         assert not r.all_passed()
 
+    def test_all_passed_after_more_adds(self):
+        r = TestResults()
+        r.add(0, AssertionResult(timestamp=0, passed=True))
+        assert r.all_passed()
+        r.add(1, AssertionResult(timestamp=1, passed=False))
+        assert not r.all_passed()
+        r.assertions.clear()
+        assert r.all_passed()
+
     def test_add_dict(self):
         r = TestResults()
         r.add(0, {"passed": True, "description": "from dict"})
@@ -28,6 +28,15 @@ class TestHTMLReport:
         assert "Test Report" in content
         assert "basic_test" in content
 
+    def test_scenario_name_escaped(self, tmp_path: Path):
+        r = TestResults()
+        r.metadata["scenario_name"] = "<b>booking</b>"
+        gen = HTMLReportGenerator()
+        out = gen.generate([r, r], output_path=tmp_path / "report.html")
+        content = out.read_text()
+        assert "&lt;b&gt;booking&lt;/b&gt;" in content
+        assert "<b>booking</b>" not in content
+
     def test_empty_results(self, tmp_path: Path):
         gen = HTMLReportGenerator()
         out = gen.generate([], output_path=tmp_path / "report.html")
@@ -84,6 +93,19 @@ class TestRegressionDetector:
         result = detector.check([r1], baseline_name="test")
         assert result.has_regression
 
+    def test_baseline_update_is_seen(self, tmp_path: Path):
+        baseline_dir = tmp_path / "baselines"
+        baseline_dir.mkdir()
+        (baseline_dir / "test.json").write_text(json.dumps({"pass_rate": 1.0}))
+        detector = RegressionDetector(baseline_dir=baseline_dir)
+
+        r = TestResults()
+        r.add(0, AssertionResult(timestamp=0, passed=False))
+        assert detector.check([r], baseline_name="test").has_regression
+
+        (baseline_dir / "test.json").write_text(json.dumps({"pass_rate": 0}))
+        assert not detector.check([r], baseline_name="test").has_regression
+
     def test_no_regression(self, tmp_path: Path):
         baseline_dir = tmp_path / "baselines"
         baseline_dir.mkdir()
@@ -95,3 +117,18 @@ class TestRegressionDetector:
         r.add(0, AssertionResult(timestamp=0, passed=True))
         result = detector.check([r], baseline_name="test")
         assert not result.has_regression
+
+    def test_metric_regression_with_full_pass_rate(self, tmp_path: Path):
+        baseline_dir = tmp_path / "baselines"
+        baseline_dir.mkdir()
+        (baseline_dir / "test.json").write_text(
+            json.dumps({"pass_rate": 1.0, "accuracy_avg": 0.9})
+        )
+        detector = RegressionDetector(baseline_dir=baseline_dir)
+
+        r = TestResults()
+        r.add(0, AssertionResult(timestamp=0, passed=True))
+        r.accuracy.overall = 0.6
+        result = detector.check([r], baseline_name="test")
+        assert result.has_regression
+        assert [x["metric"] for x in result.regressions] == ["accuracy_avg"]
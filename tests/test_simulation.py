@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import numpy as np
 import pytest
 
 from voice_test_framework.core.clock import SimulatedClock
 from voice_test_framework.core.interfaces import AudioChunk
 from voice_test_framework.simulation.audio import AudioStreamSimulator, AudioConfig, TTSEngine
-from voice_test_framework.simulation.noise import NoiseEngine, AmbientProfile, TransientNoise
+from voice_test_framework.simulation.noise import (
+    _AMBIENT_POOL_SAMPLES,
+    AmbientProfile,
+    NoiseEngine,
+    TransientNoise,
+)
 from voice_test_framework.simulation.network import NetworkSimulator
 from voice_test_framework.simulation.video import VideoStreamSimulator, VideoConfig
 from voice_test_framework.simulation.physical_world import PhysicalWorldSimulator
@@ -75,6 +83,15 @@ class TestNoiseEngine:
         engine.set_snr(10)
         assert engine.ambient.snr_db == 10
 
+    async def test_reset(self):
+        engine = NoiseEngine(profile="office")
+        engine.set_profile("street")
+        await engine.inject("transient", "phone_ring")
+        engine.reset()
+        assert engine.ambient.name == "office"
+        assert engine.ambient.snr_db == 25
+        assert engine.active_transients == []
+
     def test_mix_with_speech(self):
         engine = NoiseEngine(profile="office")
         speech = AudioChunk(data=b"\x00\x00" * 320, timestamp=0, sample_rate=16000)
@@ -82,12 +99,108 @@ class TestNoiseEngine:
         assert isinstance(mixed, AudioChunk)
         assert len(mixed.data) == len(speech.data)
 
+    def test_mix_saturates(self):
+        engine = NoiseEngine(profile="construction")
+        loud = np.full(320, 32767, dtype=np.int16).tobytes()
+        mixed = engine.mix_with_speech(AudioChunk(data=loud, timestamp=0))
+        samples = np.frombuffer(mixed.data, dtype=np.int16)
+        assert samples.min() > 0  # clipped, not wrapped around
+
+    async def test_mix_with_speech_async(self):
+        engine = NoiseEngine(profile="office")
+        for samples in (320, 8192):
+            speech = AudioChunk(data=b"\x00\x00" * samples, timestamp=0, sample_rate=16000)
+            mixed = await engine.mix_with_speech_async(speech)
+            assert len(mixed.data) == len(speech.data)
+
+    async def test_concurrent_async_mixes_keep_their_audio(self):
+        engine = NoiseEngine(profile="quiet_room")
+        up = AudioChunk(data=np.full(60000, 1000, np.int16).tobytes(), timestamp=0)
+        down = AudioChunk(data=np.full(60000, -1000, np.int16).tobytes(), timestamp=0)
+        for _ in range(50):
+            a, b = await asyncio.gather(
+                engine.mix_with_speech_async(up), engine.mix_with_speech_async(down)
+            )
+            assert np.frombuffer(a.data, np.int16).min() > 0
+            assert np.frombuffer(b.data, np.int16).max() < 0
+
+    async def test_async_mix_races_with_inject_and_reset(self):
+        engine = NoiseEngine(profile="office")
+        speech = AudioChunk(data=b"\x00\x00" * 60000, timestamp=0)
+        for _ in range(20):
+            mixes = [
+                asyncio.create_task(engine.mix_with_speech_async(speech))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            await engine.inject("transient", "keyboard")
+            engine.set_snr(10)
+            engine.reset()
+            await engine.inject("transient", "phone_ring")
+            for mixed in await asyncio.gather(*mixes):
+                assert len(mixed.data) == len(speech.data)
+
+    async def test_sync_mix_refused_during_async_mix(self):
+        engine = NoiseEngine(profile="office")
+        big = AudioChunk(data=b"\x00\x00" * 200_000, timestamp=0)
+        task = asyncio.create_task(engine.mix_with_speech_async(big))
+        await asyncio.sleep(0)
+        engine.set_snr(10)  # setters never wait for the worker
+        with pytest.raises(RuntimeError):
+            engine.mix_with_speech(AudioChunk(data=b"\x00\x00" * 320, timestamp=0))
+        await task
+        engine.mix_with_speech(AudioChunk(data=b"\x00\x00" * 320, timestamp=0))
+
+    def test_ambient_does_not_loop(self):
+        ambient = AmbientProfile(name="cafe", snr_db=15)
+        pool = _AMBIENT_POOL_SAMPLES
+        first = ambient.next_chunk(pool).copy()
+        second = ambient.next_chunk(pool)
+        assert not np.array_equal(first, second)
+        straddle = ambient.next_chunk(pool // 2 + 7)
+        straddle = np.concatenate((straddle, ambient.next_chunk(pool)))
+        assert len(straddle) == pool + pool // 2 + 7
+
+        big = ambient.next_chunk(2 * pool)
+        assert len(big) == 2 * pool
+        assert not np.array_equal(big[:pool], big[pool:])
+
+    def test_transient_batch_matches_chunks(self):
+        a = TransientNoise(source="phone_ring", duration=0.05, peak_db=-10)
+        b = TransientNoise(source="phone_ring", duration=0.05, peak_db=-10)
+        batch = a.next_batch(4, 320)
+        chunks = [b.next_chunk(320) for _ in range(4)]
+        assert batch.shape == (4, 320)
+        for row, chunk in zip(batch, chunks):
+            assert (row == chunk).all()
+        assert not batch[-1].any()  # event ended after 0.05 s
+
+    async def test_mix_batch(self):
+        engine = NoiseEngine(profile="office")
+        await engine.inject("transient", "phone_ring")
+        speech = [
+            AudioChunk(data=b"\x00\x00" * 320, timestamp=i * 0.02, sample_rate=16000)
+            for i in range(5)
+        ]
+        mixed = engine.mix_batch(speech)
+        assert len(mixed) == 5
+        assert all(len(m.data) == 640 for m in mixed)
+        assert [m.timestamp for m in mixed] == [c.timestamp for c in speech]
+
     async def test_inject_transient(self):
         engine = NoiseEngine()
         await engine.inject("transient", "phone_ring")
         assert len(engine.active_transients) == 1
         assert engine.active_transients[0].is_active()
 
+    async def test_transient_expires(self):
+        engine = NoiseEngine()
+        await engine.inject("transient", "keyboard")  # at most 1 s long
+        speech = AudioChunk(data=b"\x00\x00" * 16000, timestamp=0, sample_rate=16000)
+        engine.mix_with_speech(speech)
+        engine.mix_with_speech(speech)
+        assert engine.active_transients == []
+
 
 class TestNetworkSimulator:
 
@@ -102,6 +215,15 @@ class TestNetworkSimulator:
         assert net.base_latency == 200
         assert net.loss_rate == 0.10
 
+    def test_reset(self):
+        net = NetworkSimulator(profile="good_4g")
+        net.set_profile("elevator")
+        net.is_connected = False
+        net.reset()
+        assert net.base_latency == 50
+        assert net.loss_rate == 0.01
+        assert net.is_connected
+
     async def test_apply_passes_chunk(self):
         net = NetworkSimulator(profile="perfect")
         chunk = AudioChunk(data=b"\x01\x02", timestamp=0)
@@ -139,6 +261,14 @@ class TestPhysicalWorldSimulator:
         log = await sim.simulate_scenario("device_events")
         assert len(log) > 0
 
+    async def test_log_keeps_scenario_order(self):
+        sim = PhysicalWorldSimulator()
+        engine = NoiseEngine()
+        log = await sim.simulate_scenario("device_events", noise_engine=engine)
+        events = PhysicalWorldSimulator.SCENARIOS["device_events"]["events"]
+        assert [entry["event"] for entry in log] == events
+        assert log[2]["action"] == "transient_injected"
+
     async def test_unknown_scenario(self):
         sim = PhysicalWorldSimulator()
         log = await sim.simulate_scenario("nonexistent")
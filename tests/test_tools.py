@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+
 import pytest
 
+from voice_test_framework.core.clock import SimulatedClock
+from voice_test_framework.core.results import ToolCallRecord
 from voice_test_framework.tools.registry import MockToolRegistry
 from voice_test_framework.tools.asserter import ToolCallAsserter
 from voice_test_framework.tools.builtin_mocks import (
@@ -25,20 +30,143 @@ class TestMockToolRegistry:
         assert result.data["location"] == "Tokyo"
         assert result.latency_ms > 0
 
+    async def test_builtin_results_not_shared(self, tool_registry: MockToolRegistry):
+        first = await tool_registry.handle_call("get_weather", {"location": "Oslo"})
+        first.data["location"] = "mutated"
+        second = await tool_registry.handle_call("get_weather", {"location": "Oslo"})
+        assert second.data["location"] == "Oslo"
+        rooms = await tool_registry.handle_call("check_availability", {})
+        rooms.data["available"] = False
+        again = await tool_registry.handle_call("check_availability", {})
+        assert again.data["available"] is True
+
+    async def test_tool_mock_changes_via_replace(self, tool_registry: MockToolRegistry):
+        mock = tool_registry.tools["get_weather"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            mock.failure_rate = 1.0  # type: ignore[misc]
+        tool_registry.register_mocks(
+            {"get_weather": dataclasses.replace(mock, failure_rate=1.0, latency=(0, 0))}
+        )
+        result = await tool_registry.handle_call("get_weather", {})
+        assert not result.success
+        assert result.latency_ms == 0
+
+    def test_builtin_mocks_isolated_between_registries(self):
+        a, b = MockToolRegistry(), MockToolRegistry()
+        register_general_mocks(a)
+        register_general_mocks(b)
+        a.register_mocks(
+            {"get_weather": dataclasses.replace(a.tools["get_weather"], failure_rate=1.0)}
+        )
+        assert b.tools["get_weather"].failure_rate == 0.0
+        assert b.tools["get_weather"].never_fails
+
+    async def test_simulated_latency_leaves_clock(self, tool_registry: MockToolRegistry):
+        clock = SimulatedClock()
+        tool_registry.set_clock(clock)
+        results = await asyncio.gather(
+            tool_registry.handle_call("long_running_search", {}),
+            tool_registry.handle_call("long_running_search", {}),
+        )
+        assert all(r.success and r.latency_ms >= 3000 for r in results)
+        assert clock.now() == 0.0
+
+    async def test_async_handler(self):
+        async def lookup(args):
+            return {"echo": args["q"]}
+
+        registry = MockToolRegistry()
+        registry.register("lookup", handler=lookup, latency_ms=(0, 1))
+        result = await registry.handle_call("lookup", {"q": "hi"})
+        assert result.data == {"echo": "hi"}
+
+    async def test_async_callable_object_handler(self):
+        class Lookup:
+            async def __call__(self, args):
+                return {"echo": args["q"]}
+
+        registry = MockToolRegistry()
+        registry.register("lookup", handler=Lookup(), latency_ms=(0, 1))
+        result = await registry.handle_call("lookup", {"q": "hi"})
+        assert result.data == {"echo": "hi"}
+
     async def test_handle_unknown_tool(self, tool_registry: MockToolRegistry):
         result = await tool_registry.handle_call("nonexistent", {})
         assert not result.success
         assert "Unknown tool" in result.error
 
+    async def test_unknown_tool_still_logged(self, tool_registry: MockToolRegistry):
+        await tool_registry.handle_call("nonexistent", {})
+        await tool_registry.handle_call("nonexistent", {})
+        assert len(tool_registry.call_log) == 2
+
     async def test_call_log(self, tool_registry: MockToolRegistry):
         await tool_registry.handle_call("get_weather", {"location": "NYC"})
         assert len(tool_registry.call_log) == 1
-        assert tool_registry.call_log[0]["tool"] == "get_weather"
-
-    def test_reset(self, tool_registry: MockToolRegistry):
-        tool_registry.call_log.append({"tool": "test", "args": {}, "timestamp": 0})
+        assert tool_registry.call_log[0].tool == "get_weather"
+        assert tool_registry.call_log[0]["args"] == {"location": "NYC"}
+
+    async def test_wait_for_call(self, tool_registry: MockToolRegistry):
+        waiter = asyncio.create_task(tool_registry.wait_for_call("get_weather", timeout=1.0))
+        await asyncio.sleep(0)
+        await tool_registry.handle_call("get_weather", {"location": "Paris"})
+        result = await waiter
+        assert result.passed
+        assert result.actual == {"location": "Paris"}
+
+    async def test_wait_for_call_timeout(self, tool_registry: MockToolRegistry):
+        result = await tool_registry.wait_for_call("get_weather", timeout=0.01)
+        assert not result.passed
+
+    async def test_call_log_capacity(self):
+        registry = MockToolRegistry(call_log_capacity=3)
+        registry.register("a", handler=lambda args: None, latency_ms=(0, 1))
+        registry.register("b", handler=lambda args: None, latency_ms=(0, 1))
+        for name in ("a", "b", "a", "b", "b"):
+            await registry.handle_call(name, {})
+        asserter = ToolCallAsserter(registry)
+        assert [c.tool for c in registry.call_log] == ["a", "b", "b"]
+        asserter.assert_called_times("a", 1)
+        asserter.assert_called_times("b", 2)
+        asserter.assert_call_order("a", "b", "b")
+        with pytest.raises(AssertionError, match=r"order was \['a', 'b', 'b'\]$"):
+            asserter.assert_call_order("b", "a")
+
+    async def test_call_log_records_outcome(self):
+        registry = MockToolRegistry()
+        registry.register("flaky", handler=lambda args: None, latency_ms=(1, 2), failure_rate=1.0)
+        registry.register("ok", handler=lambda args: None, latency_ms=(1, 2))
+        failed = await registry.handle_call("flaky", {})
+        ok = await registry.handle_call("ok", {})
+        await registry.handle_call("nonexistent", {})
+        flaky_rec, ok_rec, unknown_rec = registry.call_log
+        assert not flaky_rec.success
+        assert flaky_rec.latency_ms == failed.latency_ms
+        assert ok_rec.success and ok_rec.latency_ms == ok.latency_ms
+        assert not unknown_rec.as_dict()["success"]
+
+    async def test_reset(self, tool_registry: MockToolRegistry):
+        await tool_registry.handle_call("get_weather", {"location": "NYC"})
         tool_registry.reset()
         assert len(tool_registry.call_log) == 0
+        assert tool_registry.call_log == []
+
+    async def test_reset_fails_waiters(self, tool_registry: MockToolRegistry):
+        waiter = asyncio.create_task(tool_registry.wait_for_call("get_weather", timeout=1.0))
+        await asyncio.sleep(0)
+        unknown = await tool_registry.handle_call("nonexistent", {})
+        tool_registry.reset()
+        result = await waiter
+        assert not result.passed
+        assert "reset" in result.description
+        assert await tool_registry.handle_call("nonexistent", {}) is not unknown
+
+    def test_call_log_read_only(self, tool_registry: MockToolRegistry):
+        record = ToolCallRecord(tool="test", args={}, timestamp=0)
+        with pytest.raises(AttributeError):
+            tool_registry.call_log.append(record)  # type: ignore[attr-defined]
+        with pytest.raises(TypeError):
+            tool_registry.call_log[0] = record  # type: ignore[index]
 
 
 class TestToolCallAsserter:
@@ -48,10 +176,26 @@ class TestToolCallAsserter:
         await tool_registry.handle_call("get_weather", {"location": "LA"})
         asserter.assert_called("get_weather")
 
+    async def test_assert_called_args(self, tool_registry: MockToolRegistry):
+        asserter = ToolCallAsserter(tool_registry)
+        await tool_registry.handle_call("search_web", {"query": "hotels", "filters": ["5*"]})
+        asserter.assert_called("search_web", args_contain={"filters": ["5*"]})
+        with pytest.raises(AssertionError, match="mismatch"):
+            asserter.assert_called("search_web", args_contain={"query": "flights"})
+        with pytest.raises(AssertionError, match="Missing arg"):
+            asserter.assert_called("search_web", args_contain={"page": 2})
+
     async def test_assert_not_called(self, tool_registry: MockToolRegistry):
         asserter = ToolCallAsserter(tool_registry)
         asserter.assert_not_called("create_booking")
 
+    async def test_assert_none_called(self, tool_registry: MockToolRegistry):
+        asserter = ToolCallAsserter(tool_registry)
+        await tool_registry.handle_call("get_weather", {})
+        asserter.assert_none_called("create_booking", "cancel_booking")
+        with pytest.raises(AssertionError, match="get_weather"):
+            asserter.assert_none_called("create_booking", "get_weather")
+
     async def test_assert_called_fails(self, tool_registry: MockToolRegistry):
         asserter = ToolCallAsserter(tool_registry)
         with pytest.raises(AssertionError):
@@ -62,9 +206,19 @@ class TestToolCallAsserter:
         await tool_registry.handle_call("check_availability", {})
         await tool_registry.handle_call("create_booking", {})
         asserter.assert_call_order("check_availability", "create_booking")
+        with pytest.raises(AssertionError):
+            asserter.assert_call_order("create_booking", "check_availability")
+        with pytest.raises(AssertionError):
+            asserter.assert_call_order("check_availability", "get_weather")
 
     async def test_assert_called_times(self, tool_registry: MockToolRegistry):
         asserter = ToolCallAsserter(tool_registry)
         await tool_registry.handle_call("get_weather", {})
         await tool_registry.handle_call("get_weather", {})
         asserter.assert_called_times("get_weather", 2)
+
+    async def test_reset_clears_index(self, tool_registry: MockToolRegistry):
+        asserter = ToolCallAsserter(tool_registry)
+        await tool_registry.handle_call("get_weather", {})
+        tool_registry.reset()
+        asserter.assert_not_called("get_weather")